@@ -9,33 +9,48 @@ kubectl delete -f ./team/team-service-deployment.yaml
 kubectl delete -f ./task/task-service-deployment.yaml
 kubectl delete -f ./note/note-service-deployment.yaml
 
+# The postgres PVC is kept across updates; bring its schema up to the new models
+echo "Migrating database..."
+./database/migrate.sh
+
 cp database/models.py login/models.py
 cp database/models.py team/models.py
 cp database/models.py user/models.py
 cp database/models.py task/models.py
 cp database/models.py note/models.py
 
+cp -r shared login/shared
+cp -r shared team/shared
+cp -r shared user/shared
+cp -r shared task/shared
+cp -r shared note/shared
+
 # Build Docker images
 echo "Building Docker images..."
 docker build -t login-service ./login
 minikube image load login-service:latest
 rm login/models.py
+rm -r login/shared
 
 docker build -t user-service ./user
 minikube image load user-service:latest
 rm user/models.py
+rm -r user/shared
 
 docker build -t team-service ./team
 minikube image load team-service:latest
 rm team/models.py
+rm -r team/shared
 
 docker build -t task-service ./task
 minikube image load task-service:latest
 rm task/models.py
+rm -r task/shared
 
 docker build -t note-service ./note
 minikube image load note-service:latest
 rm note/models.py
+rm -r note/shared
 
 echo "Applying Kubernetes deployment for login..."
 kubectl apply -f ./login/login-service-deployment.yaml
@@ -0,0 +1,25 @@
+#!/bin/bash
+
+# Brings an existing taskdb up to the current models. db.create_all() only creates
+# missing tables, so columns, indexes, triggers and constraints added to existing
+# tables are applied from database/migrations/*.sql, in file-name order. Every script
+# is idempotent and runs in its own transaction. A fresh database (no tables yet) is
+# skipped: create_all builds the current schema there.
+#
+# Run from the repository root with the postgres deployment up, e.g. before
+# redeploying the apps or after a helm upgrade that kept the postgres PVC. Set PSQL
+# to point it at another server, e.g. PSQL="psql -h localhost -U postgres -d taskdb".
+
+set -e
+
+PSQL="${PSQL:-kubectl exec -i deploy/postgres -- psql -U postgres -d taskdb} -v ON_ERROR_STOP=1 -q"
+
+if [ "$($PSQL -tA -c "SELECT to_regclass('public.teams') IS NOT NULL")" != "t" ]; then
+    echo "No existing schema, skipping migrations"
+    exit 0
+fi
+
+for migration in ./database/migrations/*.sql; do
+    echo "Applying $migration..."
+    $PSQL -1 -f - < "$migration"
+done
@@ -0,0 +1,24 @@
+-- teams.member_count, kept in step with team_members by a trigger (see Team in models.py)
+
+-- Hold off membership changes until the count and trigger are both in place
+LOCK TABLE team_members IN SHARE ROW EXCLUSIVE MODE;
+
+ALTER TABLE teams ADD COLUMN IF NOT EXISTS member_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE teams SET member_count = (
+    SELECT count(*) FROM team_members WHERE team_members.team_id = teams.id
+);
+
+CREATE OR REPLACE FUNCTION team_member_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE teams SET member_count = member_count + 1 WHERE id = NEW.team_id;
+    ELSE
+        UPDATE teams SET member_count = member_count - 1 WHERE id = OLD.team_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER team_members_count AFTER INSERT OR DELETE ON team_members
+FOR EACH ROW EXECUTE FUNCTION team_member_count();
@@ -0,0 +1,4 @@
+-- notes.title and notes.updated_at (see Note in models.py)
+
+ALTER TABLE notes ADD COLUMN IF NOT EXISTS title VARCHAR(200);
+ALTER TABLE notes ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITHOUT TIME ZONE;
@@ -0,0 +1,14 @@
+-- Deleting a note removes its user_notes/task_notes rows in the database (see UserNote
+-- and TaskNote in models.py); delete_note relies on this
+
+ALTER TABLE user_notes
+    DROP CONSTRAINT IF EXISTS user_notes_note_id_fkey,
+    ADD CONSTRAINT user_notes_note_id_fkey FOREIGN KEY (note_id) REFERENCES notes (id) ON DELETE CASCADE;
+
+ALTER TABLE task_notes
+    DROP CONSTRAINT IF EXISTS task_notes_note_id_fkey,
+    ADD CONSTRAINT task_notes_note_id_fkey FOREIGN KEY (note_id) REFERENCES notes (id) ON DELETE CASCADE;
+
+-- ON DELETE CASCADE lookups
+CREATE INDEX IF NOT EXISTS ix_user_notes_note ON user_notes (note_id);
+CREATE INDEX IF NOT EXISTS ix_task_notes_note ON task_notes (note_id);
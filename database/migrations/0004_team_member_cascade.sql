@@ -0,0 +1,6 @@
+-- Deleting a team removes its team_members rows in the database (see TeamMember in
+-- models.py); delete_team relies on this
+
+ALTER TABLE team_members
+    DROP CONSTRAINT IF EXISTS team_members_team_id_fkey,
+    ADD CONSTRAINT team_members_team_id_fkey FOREIGN KEY (team_id) REFERENCES teams (id) ON DELETE CASCADE;
@@ -0,0 +1,17 @@
+-- Indexes declared in __table_args__ in models.py; create_all skips tables that
+-- already exist, so databases created before them never got them
+
+CREATE INDEX IF NOT EXISTS ix_users_username_pwd ON users (username) INCLUDE (password_hash);
+
+CREATE INDEX IF NOT EXISTS ix_team_members_team_user ON team_members (team_id, user_id);
+CREATE INDEX IF NOT EXISTS ix_team_members_user ON team_members (user_id);
+
+CREATE INDEX IF NOT EXISTS ix_tasks_team_status_due ON tasks (team, status, due_date);
+
+CREATE INDEX IF NOT EXISTS ix_task_assignments_user_task ON task_assignments (user_id, task_id);
+
+CREATE INDEX IF NOT EXISTS ix_notes_created_by ON notes (created_by, id);
+
+CREATE INDEX IF NOT EXISTS ix_user_notes_user_note ON user_notes (user_id, note_id);
+
+CREATE INDEX IF NOT EXISTS ix_task_notes_task ON task_notes (task_id) INCLUDE (note_id);
@@ -1,4 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DDL, event
 
 db = SQLAlchemy()
 
@@ -13,6 +14,11 @@ class User(db.Model):
     created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
     location = db.Column(db.String(200), nullable=True)
 
+    # Covering index so the login lookup is an index-only scan
+    __table_args__ = (
+        db.Index('ix_users_username_pwd', 'username', postgresql_include=['password_hash']),
+    )
+
     def __repr__(self):
         return f'<User {self.username}>'
     
@@ -23,6 +29,11 @@ class Team(db.Model):
     name = db.Column(db.String(80), unique=True, nullable=False)
     description = db.Column(db.String(200), nullable=True)
     created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
+    member_count = db.Column(db.Integer, nullable=False, default=0, server_default='0') # maintained by trigger on team_members
+
+    # Declared here rather than as a backref so Team.members exists as soon as this module
+    # is imported (services build loader options on it at import time)
+    members = db.relationship('TeamMember', back_populates='team', lazy='selectin', cascade='all, delete-orphan', passive_deletes=True)
 
     def __repr__(self):
         return f'<Team {self.name}>'
@@ -30,16 +41,39 @@ class Team(db.Model):
 class TeamMember(db.Model): # team <-> user
     __tablename__ = 'team_members'
     id = db.Column(db.Integer, primary_key=True)
-    team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.id', ondelete='CASCADE'), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     role = db.Column(db.String(50), nullable=True)
     joined_at = db.Column(db.DateTime, default=db.func.current_timestamp())
 
-    team = db.relationship('Team', backref=db.backref('members', lazy=True))
+    team = db.relationship('Team', back_populates='members')
     user = db.relationship('User', backref=db.backref('teams', lazy=True))
 
+    __table_args__ = (
+        db.Index('ix_team_members_team_user', 'team_id', 'user_id'),
+        db.Index('ix_team_members_user', 'user_id'), # a user's memberships (colleagues, task checks)
+    )
+
     def __repr__(self):
         return f'<TeamMember UserID: {self.user_id} TeamID: {self.team_id}>'
+
+# Keep teams.member_count in step with team_members inserts/deletes
+event.listen(TeamMember.__table__, 'after_create', DDL('''
+CREATE OR REPLACE FUNCTION team_member_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE teams SET member_count = member_count + 1 WHERE id = NEW.team_id;
+    ELSE
+        UPDATE teams SET member_count = member_count - 1 WHERE id = OLD.team_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+''').execute_if(dialect='postgresql'))
+event.listen(TeamMember.__table__, 'after_create', DDL('''
+CREATE TRIGGER team_members_count AFTER INSERT OR DELETE ON team_members
+FOR EACH ROW EXECUTE FUNCTION team_member_count()
+''').execute_if(dialect='postgresql'))
     
 class Task(db.Model):
     __tablename__ = 'tasks'
@@ -53,6 +87,10 @@ class Task(db.Model):
 
     team_rel = db.relationship('Team', backref=db.backref('tasks', lazy=True))
 
+    __table_args__ = (
+        db.Index('ix_tasks_team_status_due', 'team', 'status', 'due_date'), # team listings, optionally by status
+    )
+
     def __repr__(self):
         return f'<Task {self.title} Status: {self.status}>'
     
@@ -67,41 +105,61 @@ class TaskAssignment(db.Model): # task <-> user
     task = db.relationship('Task', backref=db.backref('assignments', lazy=True))
     user = db.relationship('User', backref=db.backref('tasks_assigned', lazy=True))
 
+    __table_args__ = (
+        db.Index('ix_task_assignments_user_task', 'user_id', 'task_id'), # a user's tasks
+    )
+
     def __repr__(self):
         return f'<TaskAssignment TaskID: {self.task_id} UserID: {self.user_id}>'
     
 class Note(db.Model):
     __tablename__ = 'notes'
     id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(200), nullable=True)
     content = db.Column(db.String(1000), nullable=False)
     created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
+    updated_at = db.Column(db.DateTime, nullable=True, onupdate=db.func.now())
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
 
     created_by_rel = db.relationship('User', backref=db.backref('notes_created', lazy=True))
 
+    __table_args__ = (
+        db.Index('ix_notes_created_by', 'created_by', 'id'), # a user's notes, paged by id
+    )
+
     def __repr__(self):
-        return f'<Note ID: {self.id} TaskID: {self.task_id} UserID: {self.user_id}>'
+        return f'<Note ID: {self.id} CreatedBy: {self.created_by}>'
     
 class UserNote(db.Model): # note <-> user
     __tablename__ = 'user_notes'
     id = db.Column(db.Integer, primary_key=True)
-    note_id = db.Column(db.Integer, db.ForeignKey('notes.id'), nullable=False)
+    note_id = db.Column(db.Integer, db.ForeignKey('notes.id', ondelete='CASCADE'), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
 
-    note = db.relationship('Note', backref=db.backref('user_notes', lazy=True))
+    note = db.relationship('Note', backref=db.backref('user_notes', lazy=True, cascade='all, delete-orphan', passive_deletes=True))
     user = db.relationship('User', backref=db.backref('notes', lazy=True))
 
+    __table_args__ = (
+        db.Index('ix_user_notes_user_note', 'user_id', 'note_id'),
+        db.Index('ix_user_notes_note', 'note_id'), # ON DELETE CASCADE lookups
+    )
+
     def __repr__(self):
         return f'<UserNote NoteID: {self.note_id} UserID: {self.user_id}>'
     
 class TaskNote(db.Model): # note <-> task
     __tablename__ = 'task_notes'
     id = db.Column(db.Integer, primary_key=True)
-    note_id = db.Column(db.Integer, db.ForeignKey('notes.id'), nullable=False)
+    note_id = db.Column(db.Integer, db.ForeignKey('notes.id', ondelete='CASCADE'), nullable=False)
     task_id = db.Column(db.Integer, db.ForeignKey('tasks.id'), nullable=False)
 
-    note = db.relationship('Note', backref=db.backref('task_notes', lazy=True))
+    note = db.relationship('Note', backref=db.backref('task_notes', lazy=True, cascade='all, delete-orphan', passive_deletes=True))
     task = db.relationship('Task', backref=db.backref('notes', lazy=True))
 
+    __table_args__ = (
+        db.Index('ix_task_notes_task', 'task_id', postgresql_include=['note_id']),
+        db.Index('ix_task_notes_note', 'note_id'), # ON DELETE CASCADE lookups
+    )
+
     def __repr__(self):
         return f'<TaskNote NoteID: {self.note_id} TaskID: {self.task_id}>'
\ No newline at end of file
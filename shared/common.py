@@ -0,0 +1,38 @@
+from functools import wraps
+from flask import request, jsonify
+from flask.json.provider import JSONProvider
+import orjson
+from sqlalchemy import select, exists, bindparam
+from database.models import db, User, TeamMember
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson; responses are encoded straight to bytes"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC), mimetype='application/json')
+
+# Built once so every request reuses the compiled statement; values go in as bind parameters
+USER_BY_NAME = select(User).where(User.username == bindparam('u'))
+IS_TEAM_MEMBER = select(exists().where(TeamMember.team_id == bindparam('t'), TeamMember.user_id == bindparam('u')))
+
+def is_team_member(team_id, user_id):
+    return db.session.execute(IS_TEAM_MEMBER, {'t': team_id, 'u': user_id}).scalar()
+
+def get_user_from_headers(f):
+    """Resolve the X-User header to a User once and pass it to the handler"""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        user_name = request.headers.get('X-User')
+        if not user_name:
+            return jsonify({'error': 'X-User header is required'}), 401
+        user = db.session.execute(USER_BY_NAME, {'u': user_name}).scalar_one_or_none()
+        if user is None:
+            return jsonify({'error': 'User not found'}), 404
+        return f(user, *args, **kwargs)
+    return decorated
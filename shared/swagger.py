@@ -0,0 +1,74 @@
+import os
+from functools import lru_cache
+from flask import send_file
+from flasgger import Swagger
+import orjson
+
+@lru_cache(maxsize=None)
+def build_swagger(title, description, base_path=''):
+    """Return the flasgger (config, template) pair shared by every service.
+
+    Routes for the spec, static files and UI are mounted under base_path so
+    the gateway can route them to the right service.
+    """
+    config = {
+        "headers": [],
+        "specs": [
+            {
+                "endpoint": 'apispec',
+                "route": f'{base_path}/apispec.json',
+            }
+        ],
+        "static_url_path": f"{base_path}/flasgger_static",
+        "swagger_ui": True,
+        "specs_route": f"{base_path}/docs/"
+    }
+    template = {
+        "info": {
+            "title": title,
+            "version": "1.0",
+            "description": description
+        },
+        "securityDefinitions": {
+            "Bearer": {
+                "type": "apiKey",
+                "name": "Authorization",
+                "in": "header",
+                "description": "JWT Authorization header using the Bearer scheme. Example: 'Bearer {token}'"
+            }
+        },
+        "security": [
+            {"Bearer": []}
+        ]
+    }
+    if base_path:
+        template["basePath"] = base_path
+    return config, template
+
+def init_swagger(app, title, description, base_path=''):
+    """Mount the API docs on app.
+
+    In production point SWAGGER_SPEC_FILE at a spec built with `flask dump-apispec`;
+    it is served as a static file and flasgger (docstring YAML parsing) is skipped.
+    Otherwise flasgger serves the live spec and the dump-apispec command writes it
+    to apispec.json.
+    """
+    spec_file = os.getenv('SWAGGER_SPEC_FILE')
+    if spec_file:
+        @app.route(f'{base_path}/apispec.json', methods=['GET'])
+        def apispec():
+            return send_file(spec_file, mimetype='application/json', max_age=31536000)
+        return None
+
+    config, template = build_swagger(title, description, base_path)
+    swagger = Swagger(app, config=config, template=template)
+
+    @app.cli.command('dump-apispec')
+    def dump_apispec_command():
+        """Write the generated OpenAPI spec to apispec.json"""
+        with app.test_request_context():
+            spec = swagger.get_apispecs('apispec')
+        with open('apispec.json', 'wb') as f:
+            f.write(orjson.dumps(spec))
+
+    return swagger